@@ -5,11 +5,11 @@ Demonstrates all major features and workflows
 """
 
 import asyncio
-import sys
-import os
 
-# Add services to path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'services'))
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
 
 from chaos_engine.chaos_integration import (
     ChaosController, ChaosLayer, DataFaultInjector, MetricsObserver
@@ -26,7 +26,7 @@ async def demo_chaos_testing():
     print("="*60 + "\n")
 
     controller = ChaosController()
-    controller.register_injector(ChaosLayer.DATA, DataFaultInjector())
+    controller.register_injector(ChaosLayer.DATA, DataFaultInjector)
     controller.register_observer(MetricsObserver())
 
     # Create experiment
@@ -55,7 +55,7 @@ async def demo_collaborative_editing():
     service = CollabEditorService()
 
     # Create session
-    session = service.create_session("demo-session", "model_config.py")
+    session = await service.create_session("demo-session", "model_config.py")
 
     # Add users
     alice = User(id="user1", username="Alice")
@@ -207,4 +207,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -6,26 +6,60 @@ Integrates all services: Chaos Engine, Collaborative Editor, LLM Training, and V
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+from collections import OrderedDict
 import asyncio
-import sys
+import logging
+import logging.handlers
 import os
+import threading
 
-# Add parent directory to path to import services
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import anyio
+import msgspec
+import orjson
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+# Swap in uvloop before anything touches the event loop
+if uvloop is not None:
+    uvloop.install()
 
 from chaos_engine.chaos_integration import (
     ChaosController, ChaosLayer, DataFaultInjector,
     ModelFaultInjector, MetricsObserver
 )
-from collab_editor.collab_service import (
-    CollabEditorService, User, Operation
-)
+from collab_editor.collab_service import CollabEditorService, OperationMsg
 from llm_trainer.training_service import (
     LLMTrainingService, TokenizerService, ModelSize
 )
 from validation_engine.validation_service import ValidationEngine
 
+# Configure logging once for all services
+log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
+logging.basicConfig(level=log_level, handlers=[logging.StreamHandler()])
+if log_level != "DEBUG":
+    # Per-operation editor logs stay off the WebSocket hot path
+    logging.getLogger("collab_editor").setLevel(logging.WARNING)
+
+# Training and validation status lines are buffered in memory and written
+# in batches (or immediately on errors) instead of once per epoch/request.
+# A background task also flushes every LOG_FLUSH_INTERVAL seconds so quiet
+# servers don't sit on status lines.
+LOG_FLUSH_INTERVAL = float(os.getenv("LOG_FLUSH_INTERVAL", "1.0"))
+_status_handler = logging.handlers.MemoryHandler(
+    capacity=32,
+    flushLevel=logging.ERROR,
+    target=logging.StreamHandler()
+)
+for _name in ("llm_trainer", "validation_engine"):
+    logging.getLogger(_name).addHandler(_status_handler)
+    logging.getLogger(_name).propagate = False
+
+logger = logging.getLogger(__name__)
+
 # Initialize FastAPI
 app = FastAPI(
     title="MLOps Collaborative Platform",
@@ -50,11 +84,43 @@ tokenizer_service = TokenizerService()
 validation_engine = ValidationEngine()
 
 # Initialize chaos injectors and observers
-chaos_controller.register_injector(ChaosLayer.DATA, DataFaultInjector())
-chaos_controller.register_injector(ChaosLayer.MODEL, ModelFaultInjector())
+chaos_controller.register_injector(ChaosLayer.DATA, DataFaultInjector)
+chaos_controller.register_injector(ChaosLayer.MODEL, ModelFaultInjector)
 chaos_controller.register_observer(MetricsObserver())
 
 
+@app.on_event("startup")
+async def configure_threadpool():
+    # Sync handlers run on Starlette's threadpool; raise its default of 40.
+    # Only stateless CPU work (validation) is sync: handlers touching
+    # training jobs or collab sessions stay async, because that state is
+    # mutated on the event loop and is not safe to read from a thread.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 200
+
+
+async def _flush_status_logs():
+    while True:
+        await asyncio.sleep(LOG_FLUSH_INTERVAL)
+        _status_handler.flush()
+
+
+@app.on_event("startup")
+async def start_log_flusher():
+    app.state.log_flusher = asyncio.create_task(_flush_status_logs())
+
+
+@app.on_event("shutdown")
+def flush_checkpoints():
+    # Let background checkpoint writes land before the process exits
+    training_service.finalize()
+
+
+@app.on_event("shutdown")
+async def flush_status_logs():
+    app.state.log_flusher.cancel()
+    _status_handler.flush()
+
+
 # ==================== Pydantic Models ====================
 
 class ChaosExperimentRequest(BaseModel):
@@ -77,6 +143,11 @@ class ValidationRequest(BaseModel):
     dataset_info: Optional[Dict[str, Any]] = None
 
 
+class BatchValidationRequest(BaseModel):
+    configs: List[Dict[str, Any]]
+    dataset_info: Optional[Dict[str, Any]] = None
+
+
 class CollabSessionRequest(BaseModel):
     session_id: str
     document_id: str
@@ -87,7 +158,7 @@ class CollabSessionRequest(BaseModel):
 # ==================== Health Check ====================
 
 @app.get("/")
-async def root():
+def root():
     return {
         "name": "MLOps Collaborative Platform",
         "version": "1.0.0",
@@ -101,7 +172,7 @@ async def root():
 
 
 @app.get("/health")
-async def health_check():
+def health_check():
     return {"status": "healthy"}
 
 
@@ -171,9 +242,9 @@ async def start_training_job(job_id: str):
 async def get_training_job_status(job_id: str):
     """Get training job status"""
     status = training_service.get_job_status(job_id)
-    if "error" in status:
-        raise HTTPException(status_code=404, detail=status["error"])
-    return status
+    if status is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return status.to_dict()
 
 
 @app.get("/training/jobs")
@@ -184,10 +255,56 @@ async def list_training_jobs():
 
 # ==================== Validation Endpoints ====================
 
+# LRU of serialized validate_all results keyed on canonical JSON of the
+# inputs. Sync handlers share it from the threadpool, hence the lock.
+_VALIDATION_CACHE_SIZE = 1024
+_validation_cache: "OrderedDict[Tuple[int, bytes, Optional[bytes]], bytes]" = OrderedDict()
+_validation_cache_lock = threading.Lock()
+
+
+def validate_cached(
+    config: Dict[str, Any],
+    dataset_info: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Run validate_all, memoized on the canonical JSON of its inputs
+
+    The JSON is only the cache key; misses validate the caller's own
+    mappings. Returns a fresh dict on every call, so callers may mutate it.
+    """
+    try:
+        config_key = orjson.dumps(config, option=orjson.OPT_SORT_KEYS)
+        dataset_key = (
+            orjson.dumps(dataset_info, option=orjson.OPT_SORT_KEYS)
+            if dataset_info else None
+        )
+    except orjson.JSONEncodeError:
+        # Not representable as a key (e.g. integers wider than 64 bits)
+        return validation_engine.validate_all(config, dataset_info)
+    if b"null" in config_key or (dataset_key and b"null" in dataset_key):
+        # orjson writes None, NaN and +/-Infinity all as null, so such
+        # inputs can't share a key without mixing up their results
+        return validation_engine.validate_all(config, dataset_info)
+
+    key = (validation_engine.rules_version, config_key, dataset_key)
+    with _validation_cache_lock:
+        cached = _validation_cache.get(key)
+        if cached is not None:
+            _validation_cache.move_to_end(key)
+
+    if cached is None:
+        cached = orjson.dumps(validation_engine.validate_all(config, dataset_info))
+        with _validation_cache_lock:
+            _validation_cache[key] = cached
+            if len(_validation_cache) > _VALIDATION_CACHE_SIZE:
+                _validation_cache.popitem(last=False)
+
+    return orjson.loads(cached)
+
+
 @app.post("/validation/validate")
-async def validate_configuration(request: ValidationRequest):
+def validate_configuration(request: ValidationRequest):
     """Validate model configuration and dataset"""
-    results = validation_engine.validate_all(
+    results = validate_cached(
         config=request.config,
         dataset_info=request.dataset_info
     )
@@ -195,13 +312,31 @@ async def validate_configuration(request: ValidationRequest):
     return results
 
 
+@app.post("/validation/validate-batch")
+def validate_configurations(request: BatchValidationRequest):
+    """Validate many candidate configurations against one dataset"""
+    # Each config goes through the memo, so repeated candidates are free
+    return [
+        validate_cached(config, request.dataset_info)
+        for config in request.configs
+    ]
+
+
+@app.delete("/validation/cache")
+def clear_validation_cache():
+    """Drop memoized validation results (e.g. after rule changes)"""
+    with _validation_cache_lock:
+        _validation_cache.clear()
+    return {"success": True}
+
+
 # ==================== Collaborative Editor Endpoints ====================
 
 @app.post("/collab/sessions")
 async def create_collab_session(request: CollabSessionRequest):
     """Create or join a collaborative editing session"""
     # Create session
-    session = collab_service.create_session(
+    session = await collab_service.create_session(
         request.session_id,
         request.document_id
     )
@@ -226,34 +361,60 @@ async def get_session_state(session_id: str):
     return session.get_state()
 
 
+@app.get("/collab/sessions/{session_id}/snapshot")
+async def get_session_snapshot(session_id: str):
+    """Get full document content for clients joining or resyncing"""
+    session = collab_service.get_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    return session.get_snapshot()
+
+
 # ==================== WebSocket for Real-time Collaboration ====================
 
+# Compiled once; msgspec encodes the Operation dataclass without reflection
+_OP_DECODER = msgspec.json.Decoder(OperationMsg)
+_ENCODER = msgspec.json.Encoder()
+
+
 @app.websocket("/ws/collab/{session_id}/{user_id}")
 async def websocket_collab(websocket: WebSocket, session_id: str, user_id: str):
     """WebSocket endpoint for real-time collaboration"""
+    # Wire protocol (JSON in binary frames):
+    #   client -> server: {"type", "position", "content", "version"}
+    #   server -> client: {"success", "operation", "document_version"}
+    #     operation: {"type", "position", "content", "user_id", "version",
+    #                 "timestamp" (ISO 8601 wall-clock)}
+    # Replies carry the transformed operation, not the document. Clients
+    # apply it locally and call GET /collab/sessions/{id}/snapshot on
+    # connect or whenever document_version skips ahead of their own.
     await websocket.accept()
 
     try:
         while True:
             # Receive operation from client
-            data = await websocket.receive_json()
-
-            # Process operation
-            operation = Operation(
-                type=data["type"],
-                position=data["position"],
-                content=data["content"],
-                user_id=user_id,
-                version=data["version"]
-            )
-
-            result = await collab_service.handle_operation(session_id, operation)
+            raw = await websocket.receive_bytes()
+            try:
+                message = _OP_DECODER.decode(raw)
+            except msgspec.DecodeError as e:  # malformed JSON or bad fields
+                await websocket.send_bytes(
+                    _ENCODER.encode({"success": False, "error": str(e)})
+                )
+                continue
+
+            # Process operation on the fused path; no Operation is built
+            # unless it is applied
+            result = await collab_service.handle_message(session_id, user_id, message)
+            if result.get("success"):
+                # Monotonic timestamps are process-local; send wall-clock time
+                result["operation"] = result["operation"].to_wire()
 
             # Send result back to client
-            await websocket.send_json(result)
+            await websocket.send_bytes(_ENCODER.encode(result))
 
     except WebSocketDisconnect:
-        print(f"Client {user_id} disconnected from session {session_id}")
+        logger.info("Client %s disconnected from session %s", user_id, session_id)
 
 
 # ==================== Integrated Workflows ====================
@@ -268,7 +429,7 @@ async def train_with_validation(
     """Integrated workflow: Validate config, then train"""
 
     # Step 1: Validate configuration
-    validation_results = validation_engine.validate_all(config)
+    validation_results = validate_cached(config)
 
     if not validation_results["passed"]:
         return {
@@ -313,7 +474,7 @@ async def chaos_test_model(
 
     # Check if job exists
     job_status = training_service.get_job_status(job_id)
-    if "error" in job_status:
+    if job_status is None:
         raise HTTPException(status_code=404, detail="Training job not found")
 
     # Run chaos experiment
@@ -337,4 +498,12 @@ async def chaos_test_model(
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    config = uvicorn.Config(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop" if uvloop is not None else "asyncio",
+        http="httptools",
+        ws="websockets"
+    )
+    uvicorn.Server(config).run()
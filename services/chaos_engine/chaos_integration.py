@@ -0,0 +1,286 @@
+"""
+Chaos Engineering Integration for ML Pipelines
+Adapted from ChaosEater project
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, Any, Iterator, List, Optional, Type
+import asyncio
+import logging
+import time
+import uuid
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; kernels run as plain NumPy
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+logger = logging.getLogger(__name__)
+
+
+class ChaosLayer(Enum):
+    DATA = "data"
+    MODEL = "model"
+    INFRASTRUCTURE = "infrastructure"
+
+
+@dataclass(slots=True)
+class ChaosExperiment:
+    name: str
+    layer: ChaosLayer
+    fault_type: str
+    parameters: Dict[str, Any]
+    duration: int
+    id: Optional[str] = None
+    injector: Optional[Any] = field(default=None, repr=False)
+
+
+@njit(cache=True)
+def _score(latencies: np.ndarray, errors: np.ndarray) -> float:
+    """Resilience score: share of experiment time not spent in failure"""
+    total = latencies.sum()
+    if total <= 0.0:
+        return 100.0
+    failed = (latencies * errors).sum()
+    return 100.0 * (1.0 - failed / total)
+
+
+# Compile the kernel at import rather than on the first request's event loop
+_score(np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.float32))
+
+
+def _resolve(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+class ChaosController:
+    """Main chaos engineering controller for ML pipelines"""
+
+    def __init__(self):
+        self.injectors: Dict[ChaosLayer, Type] = {}
+        self.observers = []
+        self.active_experiments: Dict[str, ChaosExperiment] = {}
+        self._experiments_lock = asyncio.Lock()
+
+    def register_injector(self, layer: ChaosLayer, injector_cls: Type):
+        """Register fault injector class for specific layer
+
+        A fresh injector is instantiated per experiment so overlapping
+        experiments on the same layer never share fault state.
+        """
+        self.injectors[layer] = injector_cls
+
+    def register_observer(self, observer):
+        """Register metrics observer"""
+        self.observers.append(observer)
+
+    def create_experiment(
+        self,
+        name: str,
+        layer: ChaosLayer,
+        fault_type: str,
+        parameters: Dict[str, Any],
+        duration: int
+    ) -> ChaosExperiment:
+        """Create a new chaos experiment"""
+        experiment = ChaosExperiment(
+            name=name,
+            layer=layer,
+            fault_type=fault_type,
+            parameters=parameters,
+            duration=duration,
+            id=f"{name}_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+        )
+        return experiment
+
+    async def run_experiment(self, experiment: ChaosExperiment) -> Dict[str, Any]:
+        """Execute chaos experiment and collect metrics"""
+        logger.debug("🧪 Starting experiment: %s", experiment.name)
+
+        # Get appropriate injector
+        injector_cls = self.injectors.get(experiment.layer)
+        if not injector_cls:
+            raise ValueError(f"No injector registered for layer {experiment.layer}")
+
+        # Start experiment
+        start_time = time.time()
+        experiment.injector = injector_cls()
+        async with self._experiments_lock:
+            self.active_experiments[experiment.id] = experiment
+
+        error = None
+        try:
+            # Inject fault
+            await experiment.injector.inject_fault(
+                experiment.fault_type, experiment.parameters
+            )
+
+            # Wait for experiment duration on a single timer
+            await self._wait(experiment.duration)
+
+            # Stop fault injection
+            await experiment.injector.stop_fault()
+        except Exception as e:
+            # A run that breaks is a result, not an API error: record it
+            logger.error("❌ Experiment failed: %s", experiment.name, exc_info=True)
+            error = str(e)
+        finally:
+            async with self._experiments_lock:
+                self.active_experiments.pop(experiment.id, None)
+
+        # Collect metrics
+        duration = time.time() - start_time
+        metrics = {
+            "experiment_id": experiment.id,
+            "name": experiment.name,
+            "duration": duration,
+            "status": "completed" if error is None else "failed",
+            "resilience_score": self._calculate_resilience_score(
+                duration, error is not None
+            )
+        }
+        if error is not None:
+            metrics["error"] = error
+
+        # Notify observers concurrently so a slow one can't stall teardown;
+        # a failing observer is logged rather than failing the run
+        async with asyncio.TaskGroup() as tg:
+            for observer in self.observers:
+                tg.create_task(self._notify(observer, metrics))
+
+        logger.debug("✅ Experiment completed: %s", experiment.name)
+
+        return metrics
+
+    @staticmethod
+    async def _notify(observer, metrics: Dict[str, Any]):
+        try:
+            await observer.record_metrics(metrics)
+        except Exception:
+            logger.exception(
+                "Observer %s failed to record metrics", type(observer).__name__
+            )
+
+    @staticmethod
+    async def _wait(duration: float):
+        """Sleep on a loop timer rather than a sleeping coroutine"""
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        handle = loop.call_later(duration, _resolve, done)
+        try:
+            await done
+        finally:
+            handle.cancel()
+
+    def _calculate_resilience_score(self, duration: float, failed: bool) -> float:
+        """Calculate resilience score over recorded history plus this run"""
+        latencies = np.array([duration], dtype=np.float32)
+        errors = np.array([failed], dtype=np.float32)
+        for observer in self.observers:
+            if isinstance(observer, MetricsObserver) and observer.count:
+                past_latencies, past_errors = observer.window()
+                latencies = np.concatenate([past_latencies, latencies])
+                errors = np.concatenate([past_errors, errors])
+                break
+        return float(_score(latencies, errors))
+
+
+class DataFaultInjector:
+    """Inject data-layer faults"""
+
+    async def inject_fault(self, fault_type: str, parameters: Dict[str, Any]):
+        """Inject specific data fault"""
+        logger.debug("💉 Injecting %s with params: %s", fault_type, parameters)
+        # Implementation would add actual fault injection logic
+
+    async def stop_fault(self):
+        """Stop fault injection"""
+        logger.debug("🛑 Stopping fault injection")
+
+
+class ModelFaultInjector:
+    """Inject model-layer faults"""
+
+    async def inject_fault(self, fault_type: str, parameters: Dict[str, Any]):
+        logger.debug("💉 Injecting model fault: %s", fault_type)
+
+    async def stop_fault(self):
+        logger.debug("🛑 Stopping model fault")
+
+
+class MetricsObserver:
+    """Observe and record experiment metrics"""
+
+    WINDOW = 4096  # experiments considered when scoring resilience
+    CHUNK = 1024
+
+    def __init__(self):
+        # Struct-of-arrays history: one column per metric
+        self._durations = np.empty(0, dtype=np.float32)
+        self._scores = np.empty(0, dtype=np.float32)
+        self._errors = np.empty(0, dtype=np.float32)
+        self._ids: List[str] = []
+        self._names: List[str] = []
+        self._statuses: List[str] = []
+        self.count = 0
+
+    def _grow(self):
+        extra = max(self.CHUNK, self.count)
+        self._durations = np.concatenate([self._durations, np.empty(extra, dtype=np.float32)])
+        self._scores = np.concatenate([self._scores, np.empty(extra, dtype=np.float32)])
+        self._errors = np.concatenate([self._errors, np.empty(extra, dtype=np.float32)])
+
+    async def record_metrics(self, metrics: Dict[str, Any]):
+        """Record experiment metrics"""
+        if self.count == len(self._durations):
+            self._grow()
+
+        i = self.count
+        status = metrics.get("status")
+        self._durations[i] = metrics.get("duration", 0.0)
+        self._scores[i] = metrics.get("resilience_score", 0.0)
+        self._errors[i] = status != "completed"
+        self._ids.append(metrics.get("experiment_id"))
+        self._names.append(metrics.get("name"))
+        self._statuses.append(status)
+        self.count += 1
+        logger.debug(
+            "📊 Metrics recorded: Resilience Score = %s",
+            metrics.get('resilience_score', 0)
+        )
+
+    def window(self):
+        """Get (durations, errors) arrays for the most recent WINDOW experiments"""
+        start = max(0, self.count - self.WINDOW)
+        return self._durations[start:self.count], self._errors[start:self.count]
+
+    def percentile(self, field: str, q: float) -> float:
+        """Percentile of a numeric metric ("duration" or "resilience_score")"""
+        columns = {"duration": self._durations, "resilience_score": self._scores}
+        if field not in columns:
+            raise ValueError(f"Unknown metric field: {field}")
+        if not self.count:
+            return 0.0
+        return float(np.percentile(columns[field][:self.count], q))
+
+    def get_history(self) -> Iterator[Dict[str, Any]]:
+        """Iterate recorded metrics, rebuilding each entry lazily"""
+        n = self.count
+        for exp_id, name, duration, status, score in zip(
+            self._ids[:n], self._names[:n], self._durations[:n].tolist(),
+            self._statuses[:n], self._scores[:n].tolist()
+        ):
+            yield {
+                "experiment_id": exp_id,
+                "name": name,
+                "duration": duration,
+                "status": status,
+                "resilience_score": score
+            }
@@ -0,0 +1,485 @@
+"""
+Real-time Collaborative Code Editor Service
+Adapted from BroCode project
+"""
+
+from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field
+from datetime import datetime
+import asyncio
+import logging
+import random
+import sys
+import time
+
+import msgspec
+
+
+logger = logging.getLogger(__name__)
+
+# Interned operation types so type checks are identity compares
+_INSERT = sys.intern('insert')
+_DELETE = sys.intern('delete')
+
+# Offset from the monotonic clock to wall-clock time, for API responses
+_WALL_CLOCK_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+
+def wall_clock(monotonic_ns: int) -> datetime:
+    """Convert a time.monotonic_ns() timestamp to a wall-clock datetime"""
+    return datetime.fromtimestamp((monotonic_ns + _WALL_CLOCK_OFFSET_NS) / 1e9)
+
+
+@dataclass(slots=True)
+class User:
+    id: str
+    username: str
+    cursor_position: int = 0
+    connected_at_ns: int = field(default_factory=time.monotonic_ns)
+
+
+@dataclass(slots=True)
+class Operation:
+    """Represents a text operation (insert/delete)"""
+    type: str  # 'insert' or 'delete'
+    position: int
+    content: str
+    user_id: str
+    version: int
+    timestamp_ns: int = field(default_factory=time.monotonic_ns)
+
+    def __post_init__(self):
+        self.type = sys.intern(self.type)
+
+    def to_wire(self) -> Dict[str, Any]:
+        """JSON-ready view with the timestamp as wall-clock ISO time"""
+        return {
+            "type": self.type,
+            "position": self.position,
+            "content": self.content,
+            "user_id": self.user_id,
+            "version": self.version,
+            "timestamp": wall_clock(self.timestamp_ns).isoformat()
+        }
+
+
+class OperationMsg(msgspec.Struct):
+    """Wire shape of an operation sent by a WebSocket client"""
+    type: str
+    position: int
+    content: str
+    version: int
+
+
+class _RopeNode:
+    """Treap node holding one chunk of text"""
+
+    __slots__ = ("text", "size", "priority", "left", "right")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.size = len(text)
+        self.priority = random.random()
+        self.left: Optional["_RopeNode"] = None
+        self.right: Optional["_RopeNode"] = None
+
+
+def _rope_size(node: Optional[_RopeNode]) -> int:
+    return node.size if node else 0
+
+
+def _rope_update(node: _RopeNode) -> _RopeNode:
+    node.size = _rope_size(node.left) + len(node.text) + _rope_size(node.right)
+    return node
+
+
+def _rope_split(node: Optional[_RopeNode], pos: int):
+    """Split a rope into (first pos characters, remainder)"""
+    if node is None:
+        return None, None
+
+    left_size = _rope_size(node.left)
+    text_end = left_size + len(node.text)
+
+    if pos <= left_size:
+        left, node.left = _rope_split(node.left, pos)
+        return left, _rope_update(node)
+    if pos >= text_end:
+        node.right, right = _rope_split(node.right, pos - text_end)
+        return _rope_update(node), right
+
+    # Split point falls inside this node's chunk. The tail gets a fresh
+    # priority and is merged into place; inheriting the parent's priority
+    # would let repeated splits degrade the treap into a list.
+    offset = pos - left_size
+    tail = _RopeNode(node.text[offset:])
+    right = node.right
+    node.text = node.text[:offset]
+    node.right = None
+    return _rope_update(node), _rope_merge(tail, right)
+
+
+def _rope_merge(left: Optional[_RopeNode], right: Optional[_RopeNode]):
+    """Concatenate two ropes"""
+    if left is None:
+        return right
+    if right is None:
+        return left
+
+    if left.priority > right.priority:
+        left.right = _rope_merge(left.right, right)
+        return _rope_update(left)
+    right.left = _rope_merge(left, right.left)
+    return _rope_update(right)
+
+
+# Chunks below this size absorb adjacent edits instead of gaining a
+# sibling node, so typing a character at a time stays compact
+_ROPE_LEAF_MAX = 512
+
+
+def _rope_append(node: Optional[_RopeNode], text: str) -> bool:
+    """Append text to the rope's last chunk if it stays under the leaf cap"""
+    path = []
+    while node:
+        path.append(node)
+        node = node.right
+    if not path or len(path[-1].text) + len(text) > _ROPE_LEAF_MAX:
+        return False
+    path[-1].text += text
+    for node in path:
+        node.size += len(text)
+    return True
+
+
+def _rope_join(left: Optional[_RopeNode], right: Optional[_RopeNode]):
+    """Concatenate two ropes, coalescing the chunks that meet at the seam"""
+    if left and right:
+        head = right
+        while head.left:
+            head = head.left
+        if _rope_append(left, head.text):
+            # Detach the absorbed chunk; splitting on its boundary adds no node
+            _, right = _rope_split(right, len(head.text))
+    return _rope_merge(left, right)
+
+
+class RopeBuffer:
+    """Mutable rope of text chunks; insert/delete cost O(|op| + log n)"""
+
+    def __init__(self, initial_content: str = ""):
+        self._root = _RopeNode(initial_content) if initial_content else None
+
+    def __len__(self) -> int:
+        return _rope_size(self._root)
+
+    def _clamp(self, pos: int) -> int:
+        return max(0, min(pos, len(self)))
+
+    def insert(self, pos: int, text: str):
+        """Insert text at character offset pos"""
+        if not text:
+            return
+        left, right = _rope_split(self._root, self._clamp(pos))
+        if not _rope_append(left, text):
+            left = _rope_merge(left, _RopeNode(text))
+        self._root = _rope_join(left, right)
+
+    def delete(self, pos: int, length: int):
+        """Delete length characters starting at offset pos"""
+        if length <= 0:
+            return
+        pos = self._clamp(pos)
+        left, rest = _rope_split(self._root, pos)
+        _, right = _rope_split(rest, length)
+        self._root = _rope_join(left, right)
+
+    def __str__(self) -> str:
+        """Materialize the full text (in-order walk of the chunks)"""
+        chunks = []
+        stack = []
+        node = self._root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            chunks.append(node.text)
+            node = node.right
+        return "".join(chunks)
+
+
+class Document:
+    """Represents a collaborative document"""
+
+    def __init__(self, doc_id: str, initial_content: str = ""):
+        self.id = doc_id
+        self.buf = RopeBuffer(initial_content)
+        self._content: Optional[str] = initial_content
+        self.version = 0
+        self.operations_history: List[Operation] = []
+
+    @property
+    def content(self) -> str:
+        """Document text, materialized from the rope on first read after an edit"""
+        if self._content is None:
+            self._content = str(self.buf)
+        return self._content
+
+    def apply_edit(
+        self,
+        op_type: str,
+        position: int,
+        content: str,
+        user_id: str,
+        version: int
+    ) -> Operation:
+        """Apply an already-transformed edit and record it in the history
+
+        op_type must be interned. Raises if the rope rejects the edit, in
+        which case the document is left unchanged.
+        """
+        if op_type is _INSERT:
+            self.buf.insert(position, content)
+        elif op_type is _DELETE:
+            self.buf.delete(position, len(content))
+
+        self._content = None
+        self.version += 1
+        operation = Operation(op_type, position, content, user_id, version)
+        self.operations_history.append(operation)
+        return operation
+
+
+def _transform_insert_insert(p1: int, l1: int, p2: int) -> int:
+    return p2 + l1 if p1 <= p2 else p2
+
+
+def _transform_delete_insert(p1: int, l1: int, p2: int) -> int:
+    return p2 - l1 if p1 < p2 else p2
+
+
+def _transform_insert_delete(p1: int, l1: int, p2: int) -> int:
+    return p2 + l1 if p1 <= p2 else p2
+
+
+def _transform_delete_delete(p1: int, l1: int, p2: int) -> int:
+    return p2
+
+
+# (op1.type, op2.type) -> fn(op1 position, op1 content length, op2 position)
+_TRANSFORM_TABLE = {
+    (_INSERT, _INSERT): _transform_insert_insert,
+    (_DELETE, _INSERT): _transform_delete_insert,
+    (_INSERT, _DELETE): _transform_insert_delete,
+    (_DELETE, _DELETE): _transform_delete_delete,
+}
+
+
+class OperationalTransform:
+    """Operational Transform for conflict resolution"""
+
+    @staticmethod
+    def transform(op1: Operation, op2: Operation) -> Operation:
+        """Transform op2 against op1 for concurrent operations"""
+        transform_fn = _TRANSFORM_TABLE.get((op1.type, op2.type))
+        if transform_fn is not None:
+            op2.position = transform_fn(op1.position, len(op1.content), op2.position)
+
+        return op2
+
+
+class CollaborativeSession:
+    """Manages a collaborative editing session"""
+
+    def __init__(self, session_id: str, document_id: str):
+        self.id = session_id
+        self.document = Document(document_id)
+        self.users: Dict[str, User] = {}
+        self.pending_operations: List[Operation] = []
+        # Serializes OT + apply across concurrent messages for this session
+        self._lock = asyncio.Lock()
+        # Serialized user list for get_state; rebuilt after membership or
+        # cursor changes
+        self._users_cache: Optional[List[Dict[str, Any]]] = None
+
+    def add_user(self, user: User):
+        """Add user to session"""
+        self.users[user.id] = user
+        self._users_cache = None
+        logger.debug("👤 User %s joined session %s", user.username, self.id)
+
+    def remove_user(self, user_id: str):
+        """Remove user from session"""
+        if user_id in self.users:
+            user = self.users.pop(user_id)
+            self._users_cache = None
+            logger.debug("👋 User %s left session %s", user.username, self.id)
+
+    def update_cursor(self, user_id: str, position: int):
+        """Move a user's cursor (use this rather than setting it directly)"""
+        user = self.users.get(user_id)
+        if user and user.cursor_position != position:
+            user.cursor_position = position
+            self._users_cache = None
+
+    async def apply_op_fast(
+        self,
+        op_type: str,
+        position: int,
+        content: str,
+        user_id: str,
+        version: int
+    ) -> Dict[str, Any]:
+        """Transform, apply and acknowledge an operation in one pass
+
+        Works on the raw operation fields: the position is adjusted as an
+        int, the rope is edited in place, and the only objects built are
+        the history entry and the reply.
+        """
+        op_type = sys.intern(op_type)
+        document = self.document
+
+        async with self._lock:
+            for pending_op in self.pending_operations:
+                transform_fn = _TRANSFORM_TABLE.get((pending_op.type, op_type))
+                if transform_fn is not None:
+                    position = transform_fn(
+                        pending_op.position, len(pending_op.content), position
+                    )
+
+            try:
+                operation = document.apply_edit(
+                    op_type, position, content, user_id, version
+                )
+            except Exception as e:
+                logger.error("Error applying operation: %s", e)
+                return {"success": False, "error": "Failed to apply operation"}
+
+            # Broadcast the applied delta only; clients replay it locally and
+            # fetch a snapshot when they detect a version gap
+            return {
+                "success": True,
+                "operation": operation,
+                "document_version": document.version
+            }
+
+    async def process_operation(self, operation: Operation) -> Dict[str, Any]:
+        """Process incoming operation with OT"""
+        return await self.apply_op_fast(
+            operation.type,
+            operation.position,
+            operation.content,
+            operation.user_id,
+            operation.version
+        )
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        """Get full document content for (re)synchronizing a client"""
+        return {
+            "session_id": self.id,
+            "document_id": self.document.id,
+            "document_version": self.document.version,
+            "content": self.document.content
+        }
+
+    def get_state(self) -> Dict[str, Any]:
+        """Get current session state"""
+        if self._users_cache is None:
+            self._users_cache = [
+                {
+                    "id": u.id,
+                    "username": u.username,
+                    "cursor": u.cursor_position,
+                    "connected_at": wall_clock(u.connected_at_ns).isoformat()
+                }
+                for u in self.users.values()
+            ]
+
+        return {
+            "session_id": self.id,
+            "document_id": self.document.id,
+            "content": self.document.content,
+            "version": self.document.version,
+            "users": self._users_cache
+        }
+
+
+class CollabEditorService:
+    """Main collaborative editor service"""
+
+    NUM_SHARDS = 64  # power of two, so the shard is hash & (NUM_SHARDS - 1)
+
+    def __init__(self):
+        # Session map split into shards so unrelated sessions don't contend
+        self._shards = [({}, asyncio.Lock()) for _ in range(self.NUM_SHARDS)]
+
+    def _shard(self, session_id: str):
+        return self._shards[hash(session_id) & (self.NUM_SHARDS - 1)]
+
+    async def create_session(self, session_id: str, document_id: str) -> CollaborativeSession:
+        """Create or get existing session"""
+        sessions, lock = self._shard(session_id)
+        async with lock:
+            if session_id not in sessions:
+                sessions[session_id] = CollaborativeSession(session_id, document_id)
+                logger.debug("📝 Created new session: %s", session_id)
+            return sessions[session_id]
+
+    def get_session(self, session_id: str) -> Optional[CollaborativeSession]:
+        """Get existing session"""
+        # A single dict read is atomic and get_session is also called from
+        # threadpool handlers, where an asyncio.Lock can't be awaited
+        sessions, _ = self._shard(session_id)
+        return sessions.get(session_id)
+
+    async def join_session(
+        self,
+        session_id: str,
+        user_id: str,
+        username: str
+    ) -> Dict[str, Any]:
+        """User joins a session"""
+        session = self.get_session(session_id)
+        if not session:
+            return {"success": False, "error": "Session not found"}
+
+        user = User(id=user_id, username=username)
+        session.add_user(user)
+
+        return {
+            "success": True,
+            "session_state": session.get_state()
+        }
+
+    async def handle_operation(
+        self,
+        session_id: str,
+        operation: Operation
+    ) -> Dict[str, Any]:
+        """Handle incoming operation"""
+        session = self.get_session(session_id)
+        if not session:
+            return {"success": False, "error": "Session not found"}
+
+        result = await session.process_operation(operation)
+        return result
+
+    async def handle_message(
+        self,
+        session_id: str,
+        user_id: str,
+        message: OperationMsg
+    ) -> Dict[str, Any]:
+        """Handle an operation decoded straight off the wire"""
+        session = self.get_session(session_id)
+        if not session:
+            return {"success": False, "error": "Session not found"}
+
+        return await session.apply_op_fast(
+            message.type,
+            message.position,
+            message.content,
+            user_id,
+            message.version
+        )
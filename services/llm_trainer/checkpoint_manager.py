@@ -0,0 +1,47 @@
+"""
+Asynchronous checkpoint writing for training jobs
+State is staged on the caller's thread; the write happens on a worker
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional, Set
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCheckpointManager:
+    """Hands checkpoint writes to a small thread pool and tracks them"""
+
+    def __init__(self, max_workers: int = 2):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="checkpoint"
+        )
+        self._pending: Set[Future] = set()
+        self._lock = threading.Lock()
+
+    def submit(self, write: Callable[..., Any], *args: Any) -> Future:
+        """Schedule a checkpoint write and return without waiting for it"""
+        future = self._executor.submit(write, *args)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: Future):
+        with self._lock:
+            self._pending.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Checkpoint write failed", exc_info=future.exception())
+
+    def wait_all(self, timeout: Optional[float] = None) -> bool:
+        """Block until pending writes finish; False if the timeout expired"""
+        with self._lock:
+            pending = list(self._pending)
+        return not wait(pending, timeout=timeout).not_done
+
+    def finalize(self):
+        """Drain pending writes and stop the worker threads"""
+        self.wait_all()
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,120 @@
+"""
+Background batch prefetching for training dataloaders
+Produces the next batches on a CPU thread while the current one trains
+"""
+
+from typing import Any, Callable, Iterable, Optional
+import queue
+import threading
+
+
+_END = object()
+
+
+class _Failure:
+    """Carries a producer-side exception across the queue"""
+
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+def _map_tensors(fn: Callable[[Any], Any], batch: Any) -> Any:
+    """Apply fn to every tensor-like leaf of a (nested) batch"""
+    if isinstance(batch, dict):
+        return {k: _map_tensors(fn, v) for k, v in batch.items()}
+    if isinstance(batch, (list, tuple)):
+        return type(batch)(_map_tensors(fn, v) for v in batch)
+    if hasattr(batch, "to"):
+        return fn(batch)
+    return batch
+
+
+def _pin(tensor: Any) -> Any:
+    try:
+        return tensor.pin_memory()
+    except (AttributeError, RuntimeError):  # no CUDA, or not a torch tensor
+        return tensor
+
+
+class DataPrefetcher:
+    """Wraps a dataloader with a bounded queue filled by a background thread"""
+
+    def __init__(
+        self,
+        dataloader: Iterable,
+        max_prefetch: int = 2,
+        device: Optional[Any] = None
+    ):
+        self.device = device
+        self._queue: queue.Queue = queue.Queue(maxsize=max_prefetch)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._produce, args=(dataloader,), daemon=True
+        )
+        self._thread.start()
+
+    def _put(self, item: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self, dataloader: Iterable):
+        try:
+            for batch in dataloader:
+                if self.device is not None:
+                    batch = _map_tensors(_pin, batch)
+                if not self._put(batch):
+                    return
+        except Exception as e:
+            self._put(_Failure(e))
+        else:
+            self._put(_END)
+
+    def next(self) -> Optional[Any]:
+        """Get the next batch, or None once the dataloader is exhausted
+
+        Blocks until a batch is ready; call it via run_in_executor from
+        coroutines. Exceptions raised by the dataloader are re-raised here.
+        """
+        item = self._queue.get()
+        if item is _END:
+            self._queue.put(_END)
+            return None
+        if isinstance(item, _Failure):
+            raise item.exc
+        if self.device is not None:
+            item = _map_tensors(
+                lambda t: t.to(self.device, non_blocking=True), item
+            )
+        return item
+
+    def close(self):
+        """Stop the producer thread and drop any buffered batches
+
+        Consumers blocked in next() are woken and see the end of data.
+        """
+        self._stop.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait(_END)
+                break
+            except queue.Full:  # the producer slipped a batch in
+                continue
+        self._thread.join(timeout=1.0)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Any:
+        batch = self.next()
+        if batch is None:
+            raise StopIteration
+        return batch
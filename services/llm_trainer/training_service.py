@@ -0,0 +1,403 @@
+"""
+LLM Training Service
+Combines Infinity and Arkformer capabilities
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import ClassVar, Deque, Optional, Dict, Any, Iterable, List, NamedTuple
+from enum import Enum
+import asyncio
+import logging
+import weakref
+
+import numpy as np
+
+from .checkpoint_manager import AsyncCheckpointManager
+from .data_prefetcher import DataPrefetcher
+
+logger = logging.getLogger(__name__)
+
+
+class ModelSize(Enum):
+    TINY = "tiny"      # ~10M params
+    SMALL = "small"    # ~40M params
+    MEDIUM = "medium"  # ~100M params
+    LARGE = "large"    # ~350M params
+
+
+@dataclass(frozen=True, slots=True)
+class ModelConfig:
+    vocab_size: int = 32000
+    embed_dim: int = 256
+    num_heads: int = 8
+    num_layers: int = 6
+    max_seq_len: int = 1024
+    dropout: float = 0.1
+    use_flash_attention: bool = False
+
+
+@dataclass(slots=True)
+class TrainingConfig:
+    output_dir: str = "./checkpoints"
+    num_epochs: int = 3
+    micro_batch_size: int = 4
+    learning_rate: float = 5e-5
+    warmup_steps: int = 1000
+    gradient_accumulation_steps: int = 4
+    use_deepspeed: bool = False
+    deepspeed_config: Optional[str] = None
+    fp16: bool = True
+    use_data_prefetch: bool = True
+
+
+class EpochMetrics(NamedTuple):
+    epoch: int
+    loss: float
+    perplexity: float
+    learning_rate: float
+
+
+class ModelSummary(NamedTuple):
+    vocab_size: int
+    embed_dim: int
+    num_layers: int
+
+
+class JobStatus(NamedTuple):
+    """Immutable snapshot of a job's status"""
+    job_id: str
+    status: str
+    progress: float
+    metrics: Optional[EpochMetrics]
+    model_config: ModelSummary
+
+    def metrics_dict(self) -> Dict[str, Any]:
+        """Latest-epoch metrics as a dict; empty before the first epoch"""
+        return self.metrics._asdict() if self.metrics else {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready view for API responses"""
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "progress": self.progress,
+            "metrics": self.metrics_dict(),
+            "model_config": self.model_config._asdict()
+        }
+
+
+class TrainingJob:
+    """Represents a training job"""
+
+    __slots__ = (
+        "id", "model_config", "training_config", "status", "progress",
+        "epochs", "losses", "perplexities", "learning_rates",
+        "__weakref__",  # completed jobs are indexed by weak reference
+    )
+
+    def __init__(
+        self,
+        job_id: str,
+        model_config: ModelConfig,
+        training_config: TrainingConfig
+    ):
+        self.id = job_id
+        self.model_config = model_config
+        self.training_config = training_config
+        self.status = "pending"
+        self.progress = 0.0
+        # Per-epoch metric history, one list per metric
+        self.epochs: List[int] = []
+        self.losses: List[float] = []
+        self.perplexities: List[float] = []
+        self.learning_rates: List[float] = []
+
+    def update_progress(
+        self,
+        progress: float,
+        epoch: int,
+        loss: float,
+        perplexity: float,
+        learning_rate: float
+    ):
+        """Update training progress"""
+        self.progress = progress
+        self.epochs.append(epoch)
+        self.losses.append(loss)
+        self.perplexities.append(perplexity)
+        self.learning_rates.append(learning_rate)
+
+    @property
+    def last_metrics(self) -> Optional[EpochMetrics]:
+        """Metrics of the latest epoch"""
+        if not self.epochs:
+            return None
+        return EpochMetrics(
+            self.epochs[-1],
+            self.losses[-1],
+            self.perplexities[-1],
+            self.learning_rates[-1]
+        )
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Metrics of the latest epoch, as a new dict"""
+        last = self.last_metrics
+        return last._asdict() if last else {}
+
+
+class LLMTrainingService:
+    """Service for managing LLM training jobs"""
+
+    # Model config per size; ModelConfig is frozen so jobs can share these
+    _MODEL_CONFIGS: ClassVar[Dict[ModelSize, ModelConfig]] = {
+        ModelSize.TINY: ModelConfig(embed_dim=256, num_heads=8, num_layers=6),
+        ModelSize.SMALL: ModelConfig(embed_dim=512, num_heads=8, num_layers=8),
+        ModelSize.MEDIUM: ModelConfig(embed_dim=768, num_heads=12, num_layers=12),
+        ModelSize.LARGE: ModelConfig(embed_dim=1024, num_heads=16, num_layers=24),
+    }
+
+    # Completed jobs kept in full; older ones survive only as summaries
+    MAX_RETAINED_JOBS = 1024
+
+    def __init__(self):
+        self.active_jobs: Dict[str, TrainingJob] = {}
+        self.completed_jobs: Deque[TrainingJob] = deque(maxlen=self.MAX_RETAINED_JOBS)
+        # id -> job for the retained jobs; entries vanish once the deque
+        # evicts the job
+        self._completed_index: "weakref.WeakValueDictionary[str, TrainingJob]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._completed_summaries: Dict[str, JobStatus] = {}
+        self._checkpoints = AsyncCheckpointManager(max_workers=2)
+
+    def create_job(
+        self,
+        job_id: str,
+        model_size: ModelSize,
+        data_path: str,
+        custom_config: Optional[Dict[str, Any]] = None
+    ) -> TrainingJob:
+        """Create a new training job"""
+
+        # Set model config based on size
+        model_config = self._MODEL_CONFIGS[model_size]
+        training_config = TrainingConfig()
+
+        # Apply custom config if provided
+        if custom_config:
+            for key, value in custom_config.items():
+                if hasattr(training_config, key):
+                    setattr(training_config, key, value)
+
+        job = TrainingJob(job_id, model_config, training_config)
+        self.active_jobs[job_id] = job
+
+        logger.info("🚀 Created training job: %s (%s)", job_id, model_size.value)
+        return job
+
+    async def _run_epoch(self, job: TrainingJob, dataloader: Iterable):
+        """Consume one pass over the dataloader"""
+        if not job.training_config.use_data_prefetch:
+            for batch in dataloader:
+                pass  # Training step goes here
+            return
+
+        # Produce batches on a CPU thread so the next one is ready while
+        # the current one trains, without blocking the event loop
+        loop = asyncio.get_running_loop()
+        prefetcher = DataPrefetcher(dataloader)
+        try:
+            while (batch := await loop.run_in_executor(None, prefetcher.next)) is not None:
+                pass  # Training step goes here
+        finally:
+            # close() joins the producer thread; keep that off the event loop
+            await loop.run_in_executor(None, prefetcher.close)
+
+    def _record_epoch(
+        self,
+        job: TrainingJob,
+        epoch: int,
+        loss: float,
+        perplexity: float
+    ):
+        """Publish metrics for a finished epoch"""
+        job.update_progress(
+            (epoch + 1) / job.training_config.num_epochs,
+            epoch=epoch + 1,
+            loss=loss,
+            perplexity=perplexity,
+            learning_rate=job.training_config.learning_rate
+        )
+        logger.info("📊 Epoch %d: Loss=%.3f", epoch + 1, loss)
+
+    async def start_training(
+        self,
+        job_id: str,
+        dataloader: Optional[Iterable] = None
+    ) -> Dict[str, Any]:
+        """Start training job"""
+        job = self.active_jobs.get(job_id)
+        if not job:
+            return {"success": False, "error": "Job not found"}
+
+        job.status = "running"
+        logger.info("🏋️ Starting training job: %s", job_id)
+
+        # Simulated metric curves for every epoch, computed up front
+        num_epochs = job.training_config.num_epochs
+        steps = np.arange(num_epochs)
+        losses = (2.5 - 0.3 * steps).tolist()  # Simulated decreasing loss
+        perplexities = (50 - 5 * steps).tolist()
+
+        try:
+            if dataloader is not None:
+                # Real batches have to be consumed epoch by epoch
+                for epoch in range(num_epochs):
+                    await self._run_epoch(job, dataloader)
+                    await asyncio.sleep(1)
+                    self._record_epoch(job, epoch, losses[epoch], perplexities[epoch])
+            elif num_epochs > 0:
+                # Simulate the whole run with one sleep; per-epoch progress is
+                # published by loop timers instead of waking this coroutine
+                loop = asyncio.get_running_loop()
+                handles = [
+                    loop.call_later(
+                        epoch + 1, self._record_epoch,
+                        job, epoch, losses[epoch], perplexities[epoch]
+                    )
+                    for epoch in range(num_epochs - 1)
+                ]
+                try:
+                    await asyncio.sleep(num_epochs)
+                finally:
+                    for handle in handles:
+                        handle.cancel()
+                last = num_epochs - 1
+                self._record_epoch(job, last, losses[last], perplexities[last])
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+            self._retire(job)
+            raise
+        except Exception as e:
+            logger.error("❌ Training failed: %s", job_id, exc_info=True)
+            job.status = "failed"
+            self._retire(job)
+            return {"success": False, "job_id": job_id, "error": str(e)}
+
+        # Complete job
+        job.status = "completed"
+        job.progress = 1.0
+        summary = self._retire(job)
+
+        # The snapshot is staged above; the write happens off the event loop
+        checkpoint_path = f"{job.training_config.output_dir}/{job_id}"
+        self._checkpoints.submit(self._write_checkpoint, checkpoint_path, summary)
+
+        logger.info("✅ Training completed: %s", job_id)
+
+        return {
+            "success": True,
+            "job_id": job_id,
+            "final_metrics": job.metrics,
+            "checkpoint_path": checkpoint_path
+        }
+
+    def _retire(self, job: TrainingJob) -> JobStatus:
+        """Move a finished or failed job out of the active set"""
+        summary = self._job_status(job)
+        self.completed_jobs.append(job)
+        self._completed_index[job.id] = job
+        self._completed_summaries[job.id] = summary
+        del self.active_jobs[job.id]
+        return summary
+
+    @staticmethod
+    def _write_checkpoint(path: str, state: JobStatus):
+        """Persist a staged checkpoint (simulated: no weights to write yet)"""
+        logger.debug("💾 Checkpoint for %s written to %s", state.job_id, path)
+
+    def wait_for_checkpoints(self, timeout: Optional[float] = None) -> bool:
+        """Block until in-flight checkpoint writes finish"""
+        return self._checkpoints.wait_all(timeout)
+
+    def finalize(self):
+        """Drain checkpoint writes; call once on shutdown"""
+        self._checkpoints.finalize()
+
+    def get_job_status(self, job_id: str) -> Optional[JobStatus]:
+        """Get training job status, or None if the job is unknown"""
+        job = self.active_jobs.get(job_id)
+        if not job:
+            # Check completed jobs
+            job = self._completed_index.get(job_id)
+
+        if not job:
+            # Fall back to the summary of a job no longer retained in full
+            return self._completed_summaries.get(job_id)
+
+        return self._job_status(job)
+
+    def _job_status(self, job: TrainingJob) -> JobStatus:
+        model_config = job.model_config
+        return JobStatus(
+            job.id,
+            job.status,
+            job.progress,
+            job.last_metrics,
+            ModelSummary(
+                model_config.vocab_size,
+                model_config.embed_dim,
+                model_config.num_layers
+            )
+        )
+
+    def list_jobs(self) -> Dict[str, List[Dict[str, Any]]]:
+        """List all training jobs"""
+        return {
+            "active": [
+                {"id": j.id, "status": j.status, "progress": j.progress}
+                for j in self.active_jobs.values()
+            ],
+            "completed": [
+                {
+                    "id": job_id,
+                    "status": summary.status,
+                    "final_metrics": summary.metrics_dict()
+                }
+                for job_id, summary in self._completed_summaries.items()
+            ]
+        }
+
+
+class TokenizerService:
+    """Service for managing tokenizers"""
+
+    def __init__(self):
+        self.tokenizers: Dict[str, Any] = {}
+
+    def train_tokenizer(
+        self,
+        tokenizer_id: str,
+        data_path: str,
+        vocab_size: int = 32000,
+        model_type: str = "bpe"
+    ) -> Dict[str, Any]:
+        """Train a new tokenizer"""
+        logger.info("🔤 Training tokenizer: %s", tokenizer_id)
+
+        # Simulated tokenizer training
+        tokenizer_info = {
+            "id": tokenizer_id,
+            "vocab_size": vocab_size,
+            "model_type": model_type,
+            "path": f"./tokenizers/{tokenizer_id}.model"
+        }
+
+        self.tokenizers[tokenizer_id] = tokenizer_info
+        return {"success": True, "tokenizer": tokenizer_info}
+
+    def get_tokenizer(self, tokenizer_id: str) -> Optional[Dict[str, Any]]:
+        """Get tokenizer info"""
+        return self.tokenizers.get(tokenizer_id)
@@ -0,0 +1,551 @@
+"""
+Validation Engine Service
+Adapted from Newton - AI Theorem Prover
+Validates configurations, model architectures, and training logic
+"""
+
+from typing import Callable, List, Dict, Any, Mapping, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
+import ast
+import asyncio
+import logging
+import sys
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# Syntax allowed in rule conditions: comparisons and arithmetic over
+# config keys and literals. Anything else (calls, attributes, subscripts)
+# is rejected when the rule is compiled.
+# Magnitude limits for numeric config values: beyond _EXACT_INT float64
+# rounds integers, beyond _FLOAT_MAX it can't hold them at all
+_EXACT_INT = 2 ** 53
+_FLOAT_MAX = sys.float_info.max
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.Tuple, ast.Compare, ast.BoolOp, ast.BinOp,
+    ast.UnaryOp, ast.Name, ast.Load, ast.Constant,
+    ast.And, ast.Or, ast.Not, ast.UAdd, ast.USub,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+
+
+class _ConfigLookup(ast.NodeTransformer):
+    """Rewrite bare names into config["name"] lookups"""
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        lookup = ast.Subscript(
+            value=ast.Name(id="config", ctx=ast.Load()),
+            slice=ast.Constant(node.id),
+            ctx=ast.Load()
+        )
+        return ast.copy_location(lookup, node)
+
+
+class _Vectorize(ast.NodeTransformer):
+    """Rewrite boolean logic into elementwise ops so rules accept arrays
+
+    `a and b` -> `a & b`, `not a` -> `~a`, `a < b < c` -> `(a < b) & (b < c)`
+    """
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> ast.AST:
+        self.generic_visit(node)
+        op = ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr()
+        result = node.values[0]
+        for value in node.values[1:]:
+            result = ast.BinOp(left=result, op=op, right=value)
+        return ast.copy_location(result, node)
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return ast.copy_location(
+                ast.UnaryOp(op=ast.Invert(), operand=node.operand), node
+            )
+        return node
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        self.generic_visit(node)
+        operands = [node.left, *node.comparators]
+        result = None
+        for left, op, right in zip(operands, node.ops, operands[1:]):
+            pair = ast.Compare(left=left, ops=[op], comparators=[right])
+            result = pair if result is None else ast.BinOp(
+                left=result, op=ast.BitAnd(), right=pair
+            )
+        return ast.copy_location(result, node)
+
+
+def _compile_rule(
+    condition: str,
+    filename: str = "<rule>",
+    vectorized: bool = False
+) -> Callable[[Mapping[str, Any]], Any]:
+    """Compile a condition into a closure over a config mapping
+
+    With vectorized=True the closure takes a mapping of numpy arrays and
+    returns a boolean array.
+    """
+    tree = ast.parse(condition, mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(
+                f"Unsupported syntax in rule condition: {type(node).__name__}"
+            )
+
+    tree = _ConfigLookup().visit(tree)
+    if vectorized:
+        tree = _Vectorize().visit(tree)
+    body = tree.body
+    func = ast.Expression(body=ast.Lambda(
+        args=ast.arguments(
+            posonlyargs=[], args=[ast.arg(arg="config")],
+            kwonlyargs=[], kw_defaults=[], defaults=[]
+        ),
+        body=body
+    ))
+    ast.fix_missing_locations(func)
+    return eval(compile(func, filename, "eval"), {"__builtins__": {}})
+
+
+class ValidationType(Enum):
+    CONFIG = "config"
+    ARCHITECTURE = "architecture"
+    DATA = "data"
+    TRAINING = "training"
+
+
+@dataclass(slots=True)
+class ValidationRule:
+    """Represents a validation rule"""
+    name: str
+    type: ValidationType
+    condition: str
+    error_message: str
+    check: Callable[[Mapping[str, Any]], Any] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # Parse the condition once; validate() only calls the closure
+        self.check = _compile_rule(self.condition, f"<rule:{self.name}>")
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """Result of validation check"""
+    passed: bool
+    rule_name: str
+    message: str
+    severity: str = "error"  # error, warning, info
+
+
+class ConfigValidator:
+    """Validates configuration settings"""
+
+    def __init__(self):
+        self.rules: List[ValidationRule] = self._init_rules()
+        self._compile_bulk()
+
+    def _compile_bulk(self):
+        """Fuse all rule conditions into one tuple-valued closure
+
+        Call again after changing self.rules.
+        """
+        source = "(" + "".join(f"({rule.condition})," for rule in self.rules) + ")"
+        self._bulk_check = _compile_rule(source, "<rules>")
+        self._vector_check = _compile_rule(source, "<rules:vector>", vectorized=True)
+        self._rule_meta = [(rule.name, rule.error_message) for rule in self.rules]
+        # Config keys the rules reference, checked once up front
+        self._required_keys = sorted({
+            node.id
+            for node in ast.walk(ast.parse(source, mode="eval"))
+            if isinstance(node, ast.Name)
+        })
+
+    def _init_rules(self) -> List[ValidationRule]:
+        """Initialize validation rules"""
+        return [
+            ValidationRule(
+                name="vocab_size_positive",
+                type=ValidationType.CONFIG,
+                condition="vocab_size > 0",
+                error_message="Vocabulary size must be positive"
+            ),
+            ValidationRule(
+                name="embedding_dim_multiple",
+                type=ValidationType.CONFIG,
+                condition="embed_dim % num_heads == 0",
+                error_message="Embedding dimension must be divisible by number of heads"
+            ),
+            ValidationRule(
+                name="learning_rate_range",
+                type=ValidationType.CONFIG,
+                condition="0 < learning_rate < 1",
+                error_message="Learning rate must be between 0 and 1"
+            ),
+        ]
+
+    def _check_schema(self, config: Dict[str, Any]) -> Optional[ValidationResult]:
+        """Check the keys the rules need are present and numeric"""
+        missing = [key for key in self._required_keys if key not in config]
+        if missing:
+            return ValidationResult(
+                passed=False,
+                rule_name="config_schema",
+                message=f"Missing required config keys: {', '.join(missing)}",
+                severity="error"
+            )
+
+        non_numeric = [
+            key for key in self._required_keys
+            if not isinstance(config[key], (int, float))
+        ]
+        if non_numeric:
+            return ValidationResult(
+                passed=False,
+                rule_name="config_schema",
+                message=f"Config values must be numeric: {', '.join(non_numeric)}",
+                severity="error"
+            )
+
+        out_of_range = [
+            key for key in self._required_keys
+            if isinstance(config[key], int) and abs(config[key]) > _FLOAT_MAX
+        ]
+        if out_of_range:
+            return ValidationResult(
+                passed=False,
+                rule_name="config_schema",
+                message=f"Config values out of range: {', '.join(out_of_range)}",
+                severity="error"
+            )
+
+        return None
+
+    def validate(self, config: Dict[str, Any]) -> List[ValidationResult]:
+        """Validate configuration"""
+        schema_error = self._check_schema(config)
+        if schema_error:
+            return [schema_error]
+
+        try:
+            # Evaluate every rule in a single pass
+            outcomes = self._bulk_check(config)
+        except ArithmeticError:
+            # e.g. num_heads == 0; fall back to per-rule checks to
+            # attribute the error
+            return self._validate_each(config)
+
+        return [
+            ValidationResult(
+                passed=passed,
+                rule_name=name,
+                message=error_message if not passed else "✓ Passed",
+                severity="error" if not passed else "info"
+            )
+            for (name, error_message), passed in zip(self._rule_meta, outcomes)
+        ]
+
+    def validate_many(
+        self,
+        configs: Sequence[Mapping[str, Any]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Check many configs at once, e.g. the candidates of a sweep
+
+        Returns (passed, per_rule): a bool array with one entry per config,
+        and a (configs x rules) bool matrix in self.rules order. Rules run
+        as numpy ops over float64 columns, so a zero divisor makes its rule
+        fail rather than raise. Configs failing the schema check fail every
+        rule; configs with integers float64 can't hold exactly are checked
+        one by one through validate().
+        """
+        count = len(configs)
+        schema_ok = np.fromiter(
+            (self._check_schema(config) is None for config in configs),
+            dtype=bool, count=count
+        )
+        vector_ok = schema_ok & np.fromiter(
+            (ok and self._is_exact(config) for config, ok in zip(configs, schema_ok)),
+            dtype=bool, count=count
+        )
+        columns = {
+            key: np.fromiter(
+                (config[key] if ok else np.nan
+                 for config, ok in zip(configs, vector_ok)),
+                dtype=np.float64, count=count
+            )
+            for key in self._required_keys
+        }
+
+        with np.errstate(all="ignore"):
+            outcomes = self._vector_check(columns)
+
+        per_rule = np.empty((count, len(outcomes)), dtype=bool)
+        for i, outcome in enumerate(outcomes):
+            per_rule[:, i] = outcome
+        per_rule &= vector_ok[:, None]
+        for i in np.flatnonzero(schema_ok & ~vector_ok):
+            per_rule[i] = [result.passed for result in self.validate(configs[i])]
+        return per_rule.all(axis=1), per_rule
+
+    def _is_exact(self, config: Mapping[str, Any]) -> bool:
+        """True if float64 holds every rule input of config exactly"""
+        return all(
+            not isinstance(config[key], int) or abs(config[key]) <= _EXACT_INT
+            for key in self._required_keys
+        )
+
+    def _validate_each(self, config: Dict[str, Any]) -> List[ValidationResult]:
+        """Validate configuration one rule at a time"""
+        results = []
+
+        for rule in self.rules:
+            try:
+                passed = rule.check(config)
+
+                results.append(ValidationResult(
+                    passed=passed,
+                    rule_name=rule.name,
+                    message=rule.error_message if not passed else "✓ Passed",
+                    severity="error" if not passed else "info"
+                ))
+            except Exception as e:
+                results.append(ValidationResult(
+                    passed=False,
+                    rule_name=rule.name,
+                    message=f"Validation error: {str(e)}",
+                    severity="error"
+                ))
+
+        return results
+
+
+@lru_cache(maxsize=256)
+def _estimate_parameters(
+    vocab_size: int,
+    embed_dim: int,
+    num_layers: int,
+    num_heads: int
+) -> int:
+    """Estimate model parameters (memoized across validations)"""
+    # Embedding + output projection: 2 * V * E
+    # Per layer: attention Q, K, V, O (4 * E^2) + 4x-expansion FFN (8 * E^2)
+    return 2 * vocab_size * embed_dim + 12 * num_layers * embed_dim * embed_dim
+
+
+class ArchitectureValidator:
+    """Validates model architecture"""
+
+    def validate_transformer(self, config: Dict[str, Any]) -> List[ValidationResult]:
+        """Validate transformer architecture"""
+        return self.validate_dims(
+            vocab_size=config.get("vocab_size", 0),
+            embed_dim=config.get("embed_dim", 0),
+            num_layers=config.get("num_layers", 0),
+            num_heads=config.get("num_heads", 1)
+        )
+
+    def validate_dims(
+        self,
+        vocab_size: int,
+        embed_dim: int,
+        num_layers: int,
+        num_heads: int
+    ) -> List[ValidationResult]:
+        """Validate transformer architecture from already-extracted dims"""
+        results = []
+
+        # Check embedding dimension; the size estimates below are
+        # meaningless once this fails, so stop here
+        if num_heads <= 0:
+            results.append(ValidationResult(
+                passed=False,
+                rule_name="head_dimension",
+                message=f"Num heads must be positive (got {num_heads})",
+                severity="error"
+            ))
+            return results
+        if embed_dim % num_heads != 0:
+            results.append(ValidationResult(
+                passed=False,
+                rule_name="head_dimension",
+                message=f"Embed dim ({embed_dim}) must be divisible by num heads ({num_heads})",
+                severity="error"
+            ))
+            return results
+
+        head_dim = embed_dim // num_heads
+        results.append(ValidationResult(
+            passed=True,
+            rule_name="head_dimension",
+            message=f"✓ Head dimension: {head_dim}",
+            severity="info"
+        ))
+
+        # Estimate parameters
+        params = _estimate_parameters(
+            vocab_size, embed_dim, num_layers, num_heads
+        )
+
+        results.append(ValidationResult(
+            passed=True,
+            rule_name="parameter_count",
+            message=f"✓ Estimated parameters: {params / 1e6:.2f}M",
+            severity="info"
+        ))
+
+        # Memory estimation
+        memory_gb = (params * 4) / (1024 ** 3)  # FP32
+        if memory_gb > 16:
+            results.append(ValidationResult(
+                passed=True,
+                rule_name="memory_warning",
+                message=f"⚠ Large model: ~{memory_gb:.2f}GB memory required",
+                severity="warning"
+            ))
+
+        return results
+
+
+class DataValidator:
+    """Validates training data"""
+
+    def validate_dataset(self, dataset_info: Dict[str, Any]) -> List[ValidationResult]:
+        """Validate dataset"""
+        results = []
+
+        # Check dataset size
+        num_samples = dataset_info.get("num_samples", 0)
+        if num_samples < 100:
+            results.append(ValidationResult(
+                passed=False,
+                rule_name="dataset_size",
+                message=f"Dataset too small: {num_samples} samples (minimum: 100)",
+                severity="error"
+            ))
+        elif num_samples < 1000:
+            results.append(ValidationResult(
+                passed=True,
+                rule_name="dataset_size",
+                message=f"⚠ Small dataset: {num_samples} samples",
+                severity="warning"
+            ))
+        else:
+            results.append(ValidationResult(
+                passed=True,
+                rule_name="dataset_size",
+                message=f"✓ Dataset size: {num_samples} samples",
+                severity="info"
+            ))
+
+        return results
+
+
+class ValidationEngine:
+    """Main validation engine"""
+
+    def __init__(self):
+        self.config_validator = ConfigValidator()
+        self.arch_validator = ArchitectureValidator()
+        self.data_validator = DataValidator()
+
+    @property
+    def rules_version(self) -> int:
+        """Fingerprint of the active rule set, for keying cached results"""
+        return hash(tuple(
+            (rule.name, rule.condition) for rule in self.config_validator.rules
+        ))
+
+    def _validate_config_and_arch(self, config: Dict[str, Any]) -> List[ValidationResult]:
+        """Config rules, then architecture checks on dims read from config once
+
+        The rule bank still does its own schema and bulk pass over config;
+        only the architecture validator's lookups are hoisted here.
+        """
+        vocab_size = config.get("vocab_size", 0)
+        embed_dim = config.get("embed_dim", 0)
+        num_layers = config.get("num_layers", 0)
+        num_heads = config.get("num_heads", 1)
+
+        results = self.config_validator.validate(config)
+        results.extend(self.arch_validator.validate_dims(
+            vocab_size, embed_dim, num_layers, num_heads
+        ))
+        return results
+
+    def validate_all(
+        self,
+        config: Dict[str, Any],
+        dataset_info: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Run all validations"""
+        # Config and architecture validation
+        logger.info("🔍 Validating configuration and architecture...")
+        all_results = self._validate_config_and_arch(config)
+
+        # Data validation
+        if dataset_info:
+            logger.info("🔍 Validating dataset...")
+            data_results = self.data_validator.validate_dataset(dataset_info)
+            all_results.extend(data_results)
+
+        return self._summarize(all_results)
+
+    async def validate_all_async(
+        self,
+        config: Dict[str, Any],
+        dataset_info: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Run all validations, dispatching each validator to a worker thread"""
+        jobs = [
+            asyncio.to_thread(self.config_validator.validate, config),
+            asyncio.to_thread(self.arch_validator.validate_transformer, config),
+        ]
+        if dataset_info:
+            jobs.append(asyncio.to_thread(self.data_validator.validate_dataset, dataset_info))
+
+        all_results = []
+        for results in await asyncio.gather(*jobs):
+            all_results.extend(results)
+
+        return self._summarize(all_results)
+
+    def validate_batch(
+        self,
+        configs: List[Dict[str, Any]],
+        dataset_info: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Validate a batch of candidate configs against one dataset
+
+        Runs serially: the rules are GIL-bound Python, so a thread pool only
+        adds overhead. Use ConfigValidator.validate_many for a vectorized
+        pass/fail screen of large sweeps.
+        """
+        return [self.validate_all(config, dataset_info) for config in configs]
+
+    def _summarize(self, all_results: List[ValidationResult]) -> Dict[str, Any]:
+        """Summarize results"""
+        errors = [r for r in all_results if not r.passed and r.severity == "error"]
+        warnings = [r for r in all_results if r.severity == "warning"]
+        passed = len(errors) == 0
+
+        return {
+            "passed": passed,
+            "errors": [{"rule": r.rule_name, "message": r.message} for r in errors],
+            "warnings": [{"rule": r.rule_name, "message": r.message} for r in warnings],
+            "all_results": [
+                {
+                    "rule": r.rule_name,
+                    "passed": r.passed,
+                    "message": r.message,
+                    "severity": r.severity
+                }
+                for r in all_results
+            ]
+        }
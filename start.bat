@@ -7,7 +7,7 @@ echo.
 REM Check if Python is installed
 python --version >nul 2>&1
 if errorlevel 1 (
-    echo ❌ Python is not installed. Please install Python 3.8 or higher.
+    echo ❌ Python is not installed. Please install Python 3.11 or higher.
     exit /b 1
 )
 
@@ -27,7 +27,7 @@ call venv\Scripts\activate.bat
 REM Install dependencies
 echo 📥 Installing dependencies...
 pip install -q --upgrade pip
-pip install -q -r requirements.txt
+pip install -q -e .
 
 echo.
 echo ✅ Setup complete!
@@ -37,5 +37,4 @@ echo Press Ctrl+C to stop
 echo.
 
 REM Start the server
-cd services\api-gateway
-python main.py
+python -m api_gateway.main
@@ -6,7 +6,7 @@ echo ""
 
 # Check if Python is installed
 if ! command -v python3 &> /dev/null; then
-    echo "❌ Python 3 is not installed. Please install Python 3.8 or higher."
+    echo "❌ Python 3 is not installed. Please install Python 3.11 or higher."
     exit 1
 fi
 
@@ -25,7 +25,7 @@ source venv/bin/activate
 # Install dependencies
 echo "📥 Installing dependencies..."
 pip install -q --upgrade pip
-pip install -q -r requirements.txt
+pip install -q -e .
 
 echo ""
 echo "✅ Setup complete!"
@@ -35,5 +35,4 @@ echo "Press Ctrl+C to stop"
 echo ""
 
 # Start the server
-cd services/api-gateway
-python main.py
+python -m api_gateway.main
@@ -1,23 +1,27 @@
-#!/usr/bin/env python3
 """
-Quick service test script
+Quick service tests
 Tests each service independently without starting the full API
+
+Run with: pytest  (or pytest -n auto with pytest-xdist installed)
 """
 
-import sys
-import os
+import asyncio
+import math
+import random
 
-# Add services to path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'services'))
+import pytest
 
-print("🧪 Testing MLOps Platform Services\n")
-print("="*60)
+from chaos_engine.chaos_integration import ChaosController, ChaosLayer
+from collab_editor.collab_service import CollabEditorService, RopeBuffer, User
+from llm_trainer.training_service import LLMTrainingService, ModelSize
+from validation_engine.validation_service import (
+    ConfigValidator,
+    ValidationEngine,
+    _compile_rule,
+)
 
-# Test 1: Validation Engine
-print("\n1️⃣  Testing Validation Engine...")
-try:
-    from validation_engine.validation_service import ValidationEngine
 
+def test_validation_engine():
     engine = ValidationEngine()
     config = {
         "vocab_size": 32000,
@@ -28,16 +32,64 @@ try:
     }
 
     result = engine.validate_all(config)
-    status = "✅ PASS" if result["passed"] else "❌ FAIL"
-    print(f"   {status} - Validation Engine working")
-except Exception as e:
-    print(f"   ❌ FAIL - {e}")
-
-# Test 2: Chaos Engine
-print("\n2️⃣  Testing Chaos Engine...")
-try:
-    from chaos_engine.chaos_integration import ChaosController, ChaosLayer
-
+    assert result["passed"]
+
+
+@pytest.mark.parametrize("condition", [
+    "__import__('os')",           # call
+    "vocab_size.bit_length() > 0",  # attribute + call
+    "config['vocab_size'] > 0",   # subscript
+    "embed_dim ** 2 > 0",         # power
+    "1 if vocab_size else 0",     # conditional expression
+    "lambda: 0",
+    "[vocab_size]",
+])
+def test_rule_compiler_rejects_unsafe_syntax(condition):
+    with pytest.raises(ValueError, match="Unsupported syntax"):
+        _compile_rule(condition)
+
+
+def test_rule_compiler_reads_names_from_config():
+    check = _compile_rule("0 < learning_rate < 1 and not embed_dim % num_heads")
+
+    assert check({"learning_rate": 0.5, "embed_dim": 512, "num_heads": 8})
+    assert not check({"learning_rate": 2, "embed_dim": 512, "num_heads": 8})
+    with pytest.raises(KeyError):
+        check({"learning_rate": 0.5})
+
+
+def test_vectorized_rules_agree_with_validate():
+    base = {"vocab_size": 32000, "embed_dim": 512, "num_heads": 8, "learning_rate": 1e-4}
+    configs = [
+        base,
+        {**base, "vocab_size": 0},
+        {**base, "num_heads": 0},
+        {**base, "num_heads": -8},
+        {**base, "num_heads": -7},
+        {**base, "num_heads": 7, "learning_rate": 1},
+        {**base, "learning_rate": -0.5},
+        {key: value for key, value in base.items() if key != "num_heads"},
+        {**base, "vocab_size": "32000"},
+        {**base, "learning_rate": None},
+        {**base, "learning_rate": float("inf")},
+        {**base, "embed_dim": 2**60 + 1, "num_heads": 3},  # rounds in float64
+        {**base, "embed_dim": 2**60 + 2, "num_heads": 3},
+        {**base, "vocab_size": 10**400},  # beyond float64 range
+    ]
+    validator = ConfigValidator()
+
+    passed, per_rule = validator.validate_many(configs)
+
+    for config, row_passed, row in zip(configs, passed, per_rule):
+        results = validator.validate(config)
+        if results[0].rule_name == "config_schema":
+            assert not row.any()
+        else:
+            assert row.tolist() == [result.passed for result in results]
+        assert row_passed == all(result.passed for result in results)
+
+
+def test_chaos_engine():
     controller = ChaosController()
     experiment = controller.create_experiment(
         name="test",
@@ -47,29 +99,82 @@ try:
         duration=1
     )
 
-    print(f"   ✅ PASS - Chaos Engine working (Experiment: {experiment.id})")
-except Exception as e:
-    print(f"   ❌ FAIL - {e}")
+    assert experiment.id.startswith("test_")
+    assert experiment.layer is ChaosLayer.DATA
 
-# Test 3: Collaborative Editor
-print("\n3️⃣  Testing Collaborative Editor...")
-try:
-    from collab_editor.collab_service import CollabEditorService, User
 
+def test_collab_editor():
     service = CollabEditorService()
-    session = service.create_session("test-session", "test-doc")
-    user = User(id="user1", username="TestUser")
-    session.add_user(user)
+    session = asyncio.run(service.create_session("test-session", "test-doc"))
+    session.add_user(User(id="user1", username="TestUser"))
+
+    assert service.get_session("test-session") is session
+    assert "user1" in session.users
+
+
+def _clamp(pos, text):
+    return max(0, min(pos, len(text)))
+
+
+def test_rope_buffer_matches_str():
+    rng = random.Random(0)
+    rope, expected = RopeBuffer("hello"), "hello"
+
+    for _ in range(5000):
+        # Positions and lengths deliberately run past both ends
+        pos = rng.randint(-5, len(expected) + 5)
+        if rng.random() < 0.6:
+            size = rng.randint(600, 700) if rng.random() < 0.05 else rng.randint(0, 4)
+            text = "".join(rng.choice("abc") for _ in range(size))
+            rope.insert(pos, text)
+            cut = _clamp(pos, expected)
+            expected = expected[:cut] + text + expected[cut:]
+        else:
+            length = rng.randint(-1, 20)
+            rope.delete(pos, length)
+            if length > 0:
+                cut = _clamp(pos, expected)
+                expected = expected[:cut] + expected[cut + length:]
+
+        assert len(rope) == len(expected)
+    assert str(rope) == expected
+
+
+def test_rope_buffer_coalesces_small_edits():
+    def chunks(node):
+        return 0 if node is None else 1 + chunks(node.left) + chunks(node.right)
+
+    rope = RopeBuffer()
+    for i in range(10_000):
+        rope.insert(len(rope), "x")
+        rope.insert(i // 2, "y")
+
+    assert len(rope) == 20_000
+    assert chunks(rope._root) < 200  # not one node per keystroke
+
+
+def test_rope_buffer_stays_balanced():
+    rng = random.Random(1)
+    rope = RopeBuffer()
+    while len(rope) < 500_000:
+        rope.insert(rng.randint(0, len(rope)), "x" * rng.randint(1, 200))
+    for _ in range(5000):
+        rope.insert(rng.randint(0, len(rope)), "y")
+
+    nodes, depth = 0, 0
+    stack = [(rope._root, 1)]
+    while stack:
+        node, level = stack.pop()
+        if node is not None:
+            nodes += 1
+            depth = max(depth, level)
+            stack += [(node.left, level + 1), (node.right, level + 1)]
 
-    print(f"   ✅ PASS - Collaborative Editor working (Session: {session.id})")
-except Exception as e:
-    print(f"   ❌ FAIL - {e}")
+    assert len(rope) >= 500_000
+    assert depth < 4 * math.log2(nodes + 1)
 
-# Test 4: LLM Trainer
-print("\n4️⃣  Testing LLM Training Service...")
-try:
-    from llm_trainer.training_service import LLMTrainingService, ModelSize
 
+def test_llm_trainer():
     service = LLMTrainingService()
     job = service.create_job(
         job_id="test-job",
@@ -77,15 +182,5 @@ try:
         data_path="./test.txt"
     )
 
-    print(f"   ✅ PASS - LLM Trainer working (Job: {job.id})")
-except Exception as e:
-    print(f"   ❌ FAIL - {e}")
-
-# Summary
-print("\n" + "="*60)
-print("✅ All core services are functional!")
-print("\nNext steps:")
-print("  - Run 'python example_usage.py' for full demo")
-print("  - Run 'python services/api-gateway/main.py' to start API")
-print("  - Visit http://localhost:8000/docs for API documentation")
-print("="*60 + "\n")
+    assert job.id == "test-job"
+    assert service.get_job_status("test-job").status == "pending"